@@ -13,12 +13,47 @@ Athor:
 """
 
 import threading
-from flask import Flask
+import time
+from flask import Flask, abort, request
 from pymongo import MongoClient
+from pymongo.errors import ServerSelectionTimeoutError
+from shared.json_provider import register_orjson
 from flask_restx import Api
-from order_service.app.routes import api as order_api
+from order_service.app.routes import api as order_api, register_collection
 from order_service.app.events import consume_user_update_events
 
+# No legitimate payload in this service comes close to this size; larger
+# bodies are rejected before any JSON parsing or validation happens.
+MAX_BODY_BYTES = 64 * 1024
+
+def ensure_indexes(orders_collection) -> None:
+    """
+    Creates the hot-path indexes, retrying briefly in case MongoDB is
+    still starting when the service boots (compose start order is not
+    guaranteed). Index creation is idempotent, and the service can still
+    run unindexed if Mongo never becomes reachable in time.
+    Args:
+        orders_collection: The PyMongo orders collection.
+    """
+    for attempt in range(5):
+        try:
+            # The compound (orderStatus, createdAt) index also covers plain
+            # equality lookups on orderStatus (ESR ordering).
+            orders_collection.create_index('orderId', unique=True,
+                                           background=True)
+            orders_collection.create_index([('orderStatus', 1),
+                                            ('createdAt', -1)],
+                                           background=True)
+            # The event consumer syncs user updates with
+            # update_many({'userId': ...}), which would otherwise scan
+            # the whole collection on every event.
+            orders_collection.create_index('userId', background=True)
+            return
+        except ServerSelectionTimeoutError:
+            time.sleep(2)
+    print("Could not reach MongoDB to create order indexes; "
+          "continuing without them", flush=True)
+
 def start_event_consumer(app: Flask) -> None:
     """
     Starts the event consumer for the given Flask application.
@@ -49,13 +84,33 @@ def create_app() -> Flask:
     app.config.from_object('order_service.app.config.Config')
     api = Api(app)
     api.add_namespace(order_api, path='/orders')
+    # Use orjson for request parsing and response serialization
+    register_orjson(app, api)
+
+    @app.before_request
+    def reject_oversized_body() -> None:
+        if request.content_length and request.content_length > MAX_BODY_BYTES:
+            abort(413)
 
     # Initialize MongoDB client
     # print ("Connecting to MongoDB... ", app.config['MONGO_URI'])
-    mongo_client = MongoClient(app.config['MONGO_URI'])
+    # Pool sized for gevent workers: many concurrent greenlets share a
+    # bounded number of sockets, with fast failure instead of pile-ups.
+    mongo_client = MongoClient(app.config['MONGO_URI'],
+                               maxPoolSize=100,
+                               minPoolSize=20,
+                               socketTimeoutMS=5000,
+                               serverSelectionTimeoutMS=2000,
+                               compressors='zstd,zlib',
+                               zlibCompressionLevel=6)
     app.mongo_client = mongo_client
     app.db = mongo_client[app.config['DATABASE_NAME']]
     app.orders_collection = app.db['orders']
+    # Ensure the hot query paths hit indexes instead of collection scans.
+    ensure_indexes(app.orders_collection)
+    # Cache the collection in the routes module so handlers bypass the
+    # current_app proxy lookup on every request.
+    register_collection(app)
 
     # Start the event consumer in a separate thread
     event_consumer_thread = threading.Thread(target=start_event_consumer, args=(app,), daemon=True)
@@ -52,17 +52,18 @@ def consume_user_update_events() -> None:
         emails: Optional[List[str]] = event.get('userEmails')
         delivery_address: Optional[str] = event.get('deliveryAddress')
 
-        orders_collection = current_app.orders_collection
-        old_orders: List[Dict[str, Any]] = list(orders_collection.find({'userId': user_id}))
-
         update_fields: Dict[str, Any] = {}
         if emails:
             update_fields['userEmails'] = emails
         if delivery_address:
             update_fields['deliveryAddress'] = delivery_address
 
-        for order in old_orders:
-            orders_collection.update_one({'orderId': order["orderId"]}, {'$set': update_fields})
+        # One update_many replaces the old read-then-loop of update_one
+        # calls: a single wire round trip updates every order of the user.
+        if update_fields:
+            orders_collection = current_app.orders_collection
+            orders_collection.update_many({'userId': user_id},
+                                          {'$set': update_fields})
 
         ch.basic_ack(delivery_tag=method.delivery_tag)
 
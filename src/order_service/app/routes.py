@@ -20,14 +20,71 @@ Author:
 """
 
 import uuid
-from datetime import datetime
-from flask import request, Flask, current_app
+from datetime import datetime, timezone
+import fastjsonschema
+from flask import request, Flask, Response
 from flask_restx import Resource, fields
-from bson.objectid import ObjectId
+from pymongo import ReadPreference, ReturnDocument
+from pymongo.collection import Collection
 from order_service.app.models import api, order_model, delivery_address_model
-
-# The current_app variable is a proxy to the Flask application handling the request.
-current_app: Flask
+from shared.json_provider import stream_json_array
+from shared.validation import (ORDER_STATUSES, validate_order_create,
+                               validate_order_status_update,
+                               validate_order_details_update)
+
+# Cached by register_collection() so handlers reach the real PyMongo
+# Collection directly instead of paying the current_app LocalProxy
+# __getattr__ lookup on every request.
+_orders_collection: Collection = None
+_orders_read_collection: Collection = None
+
+def register_collection(app: Flask) -> None:
+    """
+    Caches the orders collection resolved by the app factory, plus a
+    secondaryPreferred handle for staleness-tolerant list reads.
+    Args:
+        app (Flask): The configured Flask application instance.
+    """
+    global _orders_collection, _orders_read_collection
+    _orders_collection = app.orders_collection
+    _orders_read_collection = app.orders_collection.with_options(
+        read_preference=ReadPreference.SECONDARY_PREFERRED)
+
+def get_orders_collection() -> Collection:
+    """Returns the cached PyMongo orders collection."""
+    return _orders_collection
+
+def get_orders_read_collection() -> Collection:
+    """
+    Returns the orders collection with secondaryPreferred reads, for
+    list queries that can offload to a secondary in a replica set.
+    """
+    return _orders_read_collection
+
+# Only the declared model fields leave the service, so fetching anything
+# else from Mongo is wasted bandwidth and BSON decode time. _id is
+# excluded because the streamed response serializes documents as-is.
+ORDER_PROJECTION: dict = {field: 1 for field in order_model.keys()}
+ORDER_PROJECTION['_id'] = 0
+
+# Pagination bounds for the list endpoints.
+DEFAULT_PAGE_SIZE: int = 50
+MAX_PAGE_SIZE: int = 200
+
+def get_pagination_args() -> tuple:
+    """
+    Parses and validates the 'page' and 'limit' query parameters.
+    Returns:
+        tuple: (page, limit) with limit capped at MAX_PAGE_SIZE.
+    """
+    try:
+        page = int(request.args.get('page', 1))
+        limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        api.abort(400, 'page and limit must be integers')
+    if page < 1 or limit < 1:
+        api.abort(400, 'page and limit must be positive')
+    return page, min(limit, MAX_PAGE_SIZE)
 
 @api.route('/')
 class OrderList(Resource):
@@ -50,68 +107,55 @@ class OrderList(Resource):
         """
         data: dict = request.json
 
-        # Ensure no additional fields are present
-        allowed_fields: set = {'items', 'userEmails', 'deliveryAddress', 'orderStatus',
-                               'createdAt', 'updatedAt', 'userId'}
-        for field in data:
-            if field not in allowed_fields:
-                api.abort(400, f'Invalid field: {field}')
-
-        if 'items' not in data or not data['items']:
-            api.abort(400, 'items is a required field')
-        if 'userEmails' not in data or not data['userEmails']:
-            api.abort(400, 'userEmails is a required field')
-        if 'deliveryAddress' not in data:
-            api.abort(400, 'deliveryAddress is a required field')
-        if 'orderStatus' not in data:
-            api.abort(400, 'orderStatus is a required field')
-
-        # Validate items
-        for item in data['items']:
-            if not isinstance(item, dict):
-                api.abort(400, 'Each item must be an object')
-            required_fields: list = ['itemId', 'quantity', 'price']
-            for field in required_fields:
-                if field not in item or not isinstance(item[field], (str, int, float)):
-                    api.abort(400, f'Each item must contain a valid {field}')
-
-        # Validate deliveryAddress
-        delivery_address: dict = data['deliveryAddress']
-        required_addr_fields: list = ['street', 'city', 'state', 'postalCode', 'country']
-        if not isinstance(delivery_address, dict):
-            api.abort(400, 'deliveryAddress must be an object')
-        for field in required_addr_fields:
-            if field not in delivery_address or not isinstance(delivery_address[field], str):
-                api.abort(400, f'deliveryAddress must contain a valid {field}')
-
-        orders_collection = current_app.orders_collection
+        # Validate against the schema compiled at import time
+        try:
+            validate_order_create(data)
+        except fastjsonschema.JsonSchemaException as e:
+            api.abort(400, e.message)
+
+        orders_collection = get_orders_collection()
 
         # Add automatic timestamps
-        current_time = datetime.utcnow()
+        current_time = datetime.now(timezone.utc)
         data['createdAt'] = current_time
         data['updatedAt'] = current_time
 
-        # Generate a unique orderId
-        data['orderId'] = str(uuid.uuid1())
-        order_id: ObjectId = orders_collection.insert_one(data).inserted_id
-        order: dict = orders_collection.find_one({'_id': ObjectId(order_id)})
-        return order, 201
+        # Generate a unique orderId. uuid4 draws straight from os.urandom,
+        # avoiding the global lock and MAC/clock lookup that uuid1 pays.
+        data['orderId'] = uuid.uuid4().hex
+        # insert_one sets data['_id'] in place, so the document we already
+        # hold is the stored one; reading it back would be a wasted round trip.
+        orders_collection.insert_one(data)
+        return data, 201
 
     @api.param('status', 'The status of the orders to retrieve')
-    @api.marshal_with(order_model, as_list=True)
-    def get(self) -> list:
+    @api.param('page', 'Page number, starting at 1')
+    @api.param('limit', f'Page size, capped at {MAX_PAGE_SIZE}')
+    @api.response(200, 'Success', [order_model])
+    def get(self) -> Response:
         """
-        Retrieves orders by status.
+        Retrieves orders by status, newest first, one page at a time.
         Expects a query parameter 'status' with one of:
         'under process', 'shipping', or 'delivered'.
+        The response is streamed straight off the Mongo cursor, one
+        document at a time, so the page is never materialized in memory.
         """
         status: str = request.args.get('status')
-        if not status or status not in ['under process', 'shipping', 'delivered']:
+        if not status or status not in ORDER_STATUSES:
             api.abort(400, 'Invalid or missing status parameter')
 
-        orders_collection = current_app.orders_collection
-        orders: list = list(orders_collection.find({'orderStatus': status}))
-        return orders
+        page, limit = get_pagination_args()
+        orders_collection = get_orders_read_collection()
+        # Sorting on createdAt keeps the query on the compound
+        # (orderStatus, createdAt desc) index; an _id sort would force an
+        # in-memory sort of every document matching the status.
+        cursor = (orders_collection.find({'orderStatus': status},
+                                         projection=ORDER_PROJECTION)
+                  .sort('createdAt', -1)
+                  .skip((page - 1) * limit)
+                  .limit(limit)
+                  .batch_size(500))
+        return Response(stream_json_array(cursor), mimetype='application/json')
 
 @api.route('/<string:id>/status')
 @api.response(404, 'Order not found')
@@ -120,7 +164,7 @@ class OrderStatus(Resource):
 
     @api.expect(api.model('OrderStatus', {
         'orderStatus': fields.String(required=True, description='Current status of the order', 
-                                     enum=['under process', 'shipping', 'delivered'])
+                                     enum=list(ORDER_STATUSES))
     }))
     @api.marshal_with(order_model)
     def put(self, id: str) -> dict:
@@ -130,21 +174,27 @@ class OrderStatus(Resource):
         """
         data: dict = request.json
 
-        if 'orderStatus' not in data or data['orderStatus'] not in ['under process', 'shipping', 'delivered']:
-            api.abort(400, 'Invalid or missing orderStatus')
+        try:
+            validate_order_status_update(data)
+        except fastjsonschema.JsonSchemaException as e:
+            api.abort(400, e.message)
 
-        orders_collection = current_app.orders_collection
-        old_order: dict = orders_collection.find_one({'orderId': id})
-        if not old_order:
-            api.abort(404, "Order not found")
+        orders_collection = get_orders_collection()
 
         # Update orderStatus and set updatedAt automatically
         updated_data = {
             'orderStatus': data['orderStatus'],
-            'updatedAt': datetime.utcnow()
+            'updatedAt': datetime.now(timezone.utc)
         }
-        orders_collection.update_one({'orderId': id}, {'$set': updated_data})
-        new_order: dict = orders_collection.find_one({'orderId': id})
+        # Single round trip: fetch the old document and apply the update
+        # atomically instead of find_one + update_one + find_one.
+        old_order: dict = orders_collection.find_one_and_update(
+            {'orderId': id}, {'$set': updated_data},
+            return_document=ReturnDocument.BEFORE)
+        if not old_order:
+            api.abort(404, "Order not found")
+        # We already know the delta, so the new document needs no second query.
+        new_order: dict = {**old_order, **updated_data}
 
         return [old_order, new_order]
 
@@ -165,39 +215,23 @@ class OrderDetails(Resource):
         """
         data: dict = request.json
 
-        # Ensure no other fields are present
-        allowed_fields: set = {'userEmails', 'deliveryAddress'}
-        for field in data:
-            if field not in allowed_fields:
-                api.abort(400, f'Invalid field: {field}')
-
-        if 'userEmails' not in data and 'deliveryAddress' not in data:
-            api.abort(400, 'Either userEmails or deliveryAddress is required')
-
-        # Validate userEmails
-        if 'userEmails' in data:
-            if not isinstance(data['userEmails'], list) or not all(isinstance(email, str) and '@' in email for email in data['userEmails']):
-                api.abort(400, 'userEmails must be an array of valid email addresses')
-
-        # Validate deliveryAddress
-        if 'deliveryAddress' in data:
-            delivery_address: dict = data['deliveryAddress']
-            required_addr_fields: list = ['street', 'city', 'state', 'postalCode', 'country']
-            if not isinstance(delivery_address, dict):
-                api.abort(400, 'deliveryAddress must be an object')
-            for field in required_addr_fields:
-                if field not in delivery_address or not isinstance(delivery_address[field], str):
-                    api.abort(400, f'deliveryAddress must contain a valid {field}')
-
-        orders_collection = current_app.orders_collection
-        old_order: dict = orders_collection.find_one({'orderId': id})
-        if not old_order:
-            api.abort(404, "Order not found")
+        try:
+            validate_order_details_update(data)
+        except fastjsonschema.JsonSchemaException as e:
+            api.abort(400, e.message)
+
+        orders_collection = get_orders_collection()
 
         # Set updatedAt automatically
-        data['updatedAt'] = datetime.utcnow()
+        data['updatedAt'] = datetime.now(timezone.utc)
 
-        orders_collection.update_one({'orderId': id}, {'$set': data})
-        new_order: dict = orders_collection.find_one({'orderId': id})
+        # Single round trip: fetch the old document and apply the update
+        # atomically instead of find_one + update_one + find_one.
+        old_order: dict = orders_collection.find_one_and_update(
+            {'orderId': id}, {'$set': data},
+            return_document=ReturnDocument.BEFORE)
+        if not old_order:
+            api.abort(404, "Order not found")
+        new_order: dict = {**old_order, **data}
 
         return [old_order, new_order]
@@ -0,0 +1,65 @@
+"""_summary_
+Provides orjson-backed JSON handling for the Flask services. orjson encodes
+and decodes in C, which is substantially faster than the stdlib json module
+used by default for both request parsing and response serialization.
+
+Classes:
+    OrjsonProvider: Flask JSONProvider that delegates to orjson.
+Functions:
+    output_json(data, code, headers): orjson-based Flask-RESTx representation.
+    register_orjson(app, api): Installs orjson on a Flask app and RESTx Api.
+    stream_json_array(cursor): Streams an iterable of documents as a JSON array.
+"""
+
+from typing import Any, Iterable, Iterator, Optional
+import orjson
+from flask import Flask, make_response
+from flask.json.provider import JSONProvider
+from flask_restx import Api
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider that serializes and parses with orjson."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=str).decode()
+
+    def loads(self, s: bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+def output_json(data: Any, code: int, headers: Optional[dict] = None):
+    """
+    Flask-RESTx representation that serializes responses with orjson
+    instead of the stdlib json module.
+    """
+    response = make_response(orjson.dumps(data, default=str), code)
+    response.headers.extend(headers or {})
+    response.mimetype = 'application/json'
+    return response
+
+
+def stream_json_array(cursor: Iterable[dict]) -> Iterator[bytes]:
+    """
+    Yields the documents of a cursor as one JSON array, encoding a document
+    at a time so the full result set is never materialized in memory.
+    """
+    yield b'['
+    first = True
+    for doc in cursor:
+        prefix = b'' if first else b','
+        yield prefix + orjson.dumps(doc, default=str)
+        first = False
+    yield b']'
+
+
+def register_orjson(app: Flask, api: Api) -> None:
+    """
+    Installs orjson for both request parsing (request.json goes through
+    app.json.loads) and response serialization on the given app and Api.
+    Args:
+        app (Flask): The Flask application instance.
+        api (Api): The Flask-RESTx Api bound to the app.
+    """
+    app.json = OrjsonProvider(app)
+    api.representations['application/json'] = output_json
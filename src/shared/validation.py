@@ -0,0 +1,109 @@
+"""_summary_
+Shared request-payload validation for the user and order services. The JSON
+Schemas below describe every write payload in the system and are compiled
+once at import time with fastjsonschema, so each service validates a request
+with a single call into generated code instead of keeping its own copy of
+the field-by-field checks.
+
+Constants:
+    ORDER_STATUSES: The valid order status values.
+Validators (compiled fastjsonschema callables):
+    validate_order_create, validate_order_status_update,
+    validate_order_details_update, validate_user_create, validate_user_update
+"""
+
+import fastjsonschema
+
+# The valid order status values, shared by schemas and route handlers.
+ORDER_STATUSES: tuple = ('under process', 'shipping', 'delivered')
+
+DELIVERY_ADDRESS_SCHEMA: dict = {
+    'type': 'object',
+    'properties': {
+        'street': {'type': 'string'},
+        'city': {'type': 'string'},
+        'state': {'type': 'string'},
+        'postalCode': {'type': 'string'},
+        'country': {'type': 'string'}
+    },
+    'required': ['street', 'city', 'state', 'postalCode', 'country']
+}
+
+ORDER_CREATE_SCHEMA: dict = {
+    'type': 'object',
+    'properties': {
+        'items': {
+            'type': 'array',
+            'minItems': 1,
+            'maxItems': 500,
+            'items': {
+                'type': 'object',
+                'properties': {
+                    'itemId': {'type': ['string', 'number']},
+                    'quantity': {'type': ['string', 'number']},
+                    'price': {'type': ['string', 'number']}
+                },
+                'required': ['itemId', 'quantity', 'price']
+            }
+        },
+        'userEmails': {'type': 'array', 'minItems': 1, 'items': {'type': 'string'}},
+        'deliveryAddress': DELIVERY_ADDRESS_SCHEMA,
+        'orderStatus': {'type': 'string', 'enum': list(ORDER_STATUSES)},
+        'createdAt': {},
+        'updatedAt': {},
+        'userId': {'type': 'string'}
+    },
+    'required': ['items', 'userEmails', 'deliveryAddress', 'orderStatus'],
+    'additionalProperties': False
+}
+
+ORDER_STATUS_UPDATE_SCHEMA: dict = {
+    'type': 'object',
+    'properties': {
+        'orderStatus': {'type': 'string', 'enum': list(ORDER_STATUSES)}
+    },
+    'required': ['orderStatus'],
+    'additionalProperties': False
+}
+
+ORDER_DETAILS_UPDATE_SCHEMA: dict = {
+    'type': 'object',
+    'properties': {
+        'userEmails': {'type': 'array', 'items': {'type': 'string', 'pattern': '@'}},
+        'deliveryAddress': DELIVERY_ADDRESS_SCHEMA
+    },
+    'anyOf': [{'required': ['userEmails']}, {'required': ['deliveryAddress']}],
+    'additionalProperties': False
+}
+
+USER_CREATE_SCHEMA: dict = {
+    'type': 'object',
+    'properties': {
+        'emails': {'type': 'array', 'minItems': 1,
+                   'items': {'type': 'string', 'pattern': '@'}},
+        'deliveryAddress': DELIVERY_ADDRESS_SCHEMA,
+        'firstName': {'type': 'string'},
+        'lastName': {'type': 'string'},
+        'phoneNumber': {'type': 'string'},
+        'createdAt': {},
+        'updatedAt': {}
+    },
+    'required': ['emails', 'deliveryAddress'],
+    'additionalProperties': False
+}
+
+USER_UPDATE_SCHEMA: dict = {
+    'type': 'object',
+    'properties': {
+        'emails': {'type': 'array', 'items': {'type': 'string', 'pattern': '@'}},
+        'deliveryAddress': DELIVERY_ADDRESS_SCHEMA
+    },
+    'anyOf': [{'required': ['emails']}, {'required': ['deliveryAddress']}],
+    'additionalProperties': False
+}
+
+validate_order_create = fastjsonschema.compile(ORDER_CREATE_SCHEMA)
+validate_order_status_update = fastjsonschema.compile(ORDER_STATUS_UPDATE_SCHEMA)
+validate_order_details_update = fastjsonschema.compile(ORDER_DETAILS_UPDATE_SCHEMA)
+validate_user_create = fastjsonschema.compile(USER_CREATE_SCHEMA)
+validate_user_update = fastjsonschema.compile(USER_UPDATE_SCHEMA)
@@ -1,4 +1,5 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 import pika
 from shared.config.rabbitmq_config import create_channel
 import os
@@ -7,20 +8,34 @@ from dotenv import load_dotenv
 load_dotenv()
 QUEUE_NAME = os.getenv('RABBITMQ_QUEUE_NAME')
 
+# Publishing runs on this pool so broker latency never sits on the HTTP
+# request path. Each task opens its own channel and connection, so no
+# pika state is shared between threads.
+_PUBLISH_POOL = ThreadPoolExecutor(max_workers=4)
+
 def publish_user_update_event(user_id, email, address):
-    channel, connection = create_channel(QUEUE_NAME)
+    """Queue the publish on a background thread and return immediately."""
+    _PUBLISH_POOL.submit(_publish, user_id, email, address)
+
+def _publish(user_id, email, address):
     event = {
         'userId': user_id,
         'userEmails': email,
         'deliveryAddress': address
     }
-    channel.basic_publish(
-        exchange="user_order",
-        routing_key=QUEUE_NAME,
-        body=json.dumps(event)
-        # properties=pika.BasicProperties(
-        #     delivery_mode=2,  # Make the message persistent
-        # )
-    )
-    print(f" V1 Published event: {event}", flush=True)
-    connection.close()
+    # Exceptions raised here would otherwise vanish inside the pool's
+    # Future, so log any broker failure instead of losing it silently.
+    try:
+        channel, connection = create_channel(QUEUE_NAME)
+        channel.basic_publish(
+            exchange="user_order",
+            routing_key=QUEUE_NAME,
+            body=json.dumps(event)
+            # properties=pika.BasicProperties(
+            #     delivery_mode=2,  # Make the message persistent
+            # )
+        )
+        print(f" V1 Published event: {event}", flush=True)
+        connection.close()
+    except Exception as e:
+        print(f" V1 Failed to publish event {event}: {e}", flush=True)
@@ -14,14 +14,85 @@ Note:
     This is v1, but with automatic timestamps similar to v2.
 """
 import uuid
-from datetime import datetime
-from bson.objectid import ObjectId
-from flask import request, Flask, current_app
+from datetime import datetime, timezone
+from cachetools import TTLCache
+import fastjsonschema
+from pymongo import ReadPreference, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from pymongo.collection import Collection
+from flask import request, Flask, Response
 from flask_restx import Namespace, Resource, fields
 from user_service_v1.app.models import api, user_model
 from user_service_v1.app.events import publish_user_update_event
-# current_app is a proxy to the Flask application handling the request.
-current_app: Flask
+from shared.json_provider import stream_json_array
+from shared.validation import validate_user_create, validate_user_update
+
+# Cached by register_collection() so handlers reach the real PyMongo
+# Collection directly instead of paying the current_app LocalProxy
+# __getattr__ lookup on every request.
+_users_collection: Collection = None
+_users_read_collection: Collection = None
+# Whether the unique emails index exists. When the factory could not
+# create it (Mongo down at boot, or legacy duplicates in the collection)
+# the handlers pre-check uniqueness with a query instead.
+_email_index_ok: bool = False
+
+def register_collection(app: Flask) -> None:
+    """Cache the users collection resolved by the app factory, plus a
+    secondaryPreferred handle for staleness-tolerant list reads."""
+    global _users_collection, _users_read_collection, _email_index_ok
+    _users_collection = app.users_collection
+    _users_read_collection = app.users_collection.with_options(
+        read_preference=ReadPreference.SECONDARY_PREFERRED)
+    _email_index_ok = getattr(app, 'email_uniqueness_indexed', False)
+
+def emails_in_use(users_collection: Collection, emails: list,
+                  exclude_user_id: str = None) -> bool:
+    """Check whether any of the given emails belongs to another user.
+    Only used when the unique emails index could not be created, since
+    the index enforces the same rule atomically and for free."""
+    query = {'emails': {'$in': emails}}
+    if exclude_user_id is not None:
+        query['userId'] = {'$ne': exclude_user_id}
+    return users_collection.count_documents(query, limit=1) > 0
+
+def get_users_collection() -> Collection:
+    """Return the cached PyMongo users collection."""
+    return _users_collection
+
+def get_users_read_collection() -> Collection:
+    """Return the users collection with secondaryPreferred reads, for
+    list queries that can offload to a secondary in a replica set."""
+    return _users_read_collection
+
+# Only the declared model fields leave the service, so fetching anything
+# else from Mongo is wasted bandwidth and BSON decode time. _id is
+# excluded because the streamed response serializes documents as-is.
+USER_PROJECTION = {field: 1 for field in user_model.keys()}
+USER_PROJECTION['_id'] = 0
+
+# Pagination bounds for the list endpoint.
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Hot single-user GETs are served from memory for a short window. The
+# cache is per gunicorn worker: a PUT only invalidates the worker that
+# handled it, so the other workers can serve the pre-update document
+# until their entry expires. The TTL is kept to a few seconds to bound
+# that staleness; the window is documented on the GET endpoint.
+CACHE_TTL_SECONDS = 3
+_USER_CACHE = TTLCache(maxsize=10_000, ttl=CACHE_TTL_SECONDS)
+
+def get_pagination_args():
+    """Parse and validate the 'page' and 'limit' query parameters."""
+    try:
+        page = int(request.args.get('page', 1))
+        limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        api.abort(400, 'page and limit must be integers')
+    if page < 1 or limit < 1:
+        api.abort(400, 'page and limit must be positive')
+    return page, min(limit, MAX_PAGE_SIZE)
 @api.route('/')
 class UserList(Resource):
     """
@@ -29,17 +100,23 @@ class UserList(Resource):
       - GET: retrieve all users
       - POST: create a new user
     """
-    @api.marshal_list_with(user_model, code=200)
+    @api.param('page', 'Page number, starting at 1')
+    @api.param('limit', f'Page size, capped at {MAX_PAGE_SIZE}')
+    @api.response(200, 'Success', [user_model])
     def get(self):
         """
-        Retrieve all users from the database.
-        
-        Returns:
-            list[dict]: A list of all user documents.
+        Retrieve users from the database, newest first, one page at a time.
+        The response is streamed straight off the Mongo cursor, one
+        document at a time, so the page is never materialized in memory.
         """
-        users_collection = current_app.users_collection
-        all_users = list(users_collection.find())
-        return all_users, 200
+        page, limit = get_pagination_args()
+        users_collection = get_users_read_collection()
+        cursor = (users_collection.find({}, projection=USER_PROJECTION)
+                  .sort('_id', -1)
+                  .skip((page - 1) * limit)
+                  .limit(limit)
+                  .batch_size(500))
+        return Response(stream_json_array(cursor), mimetype='application/json')
     @api.expect(user_model)
     @api.marshal_with(user_model, code=201)
     def post(self) -> tuple:
@@ -58,39 +135,33 @@ class UserList(Resource):
             data: dict = request.json
         except Exception as e:
             api.abort(400, f'Invalid JSON data: {str(e)}')
-        allowed_fields = {
-            'emails', 'deliveryAddress', 'firstName', 'lastName',
-            'phoneNumber', 'createdAt', 'updatedAt'
-        }
-        for field in data:
-            if field not in allowed_fields:
-                api.abort(400, f'Invalid field: {field}')
-        if 'emails' not in data or not data['emails']:
-            api.abort(400, 'emails is a required field')
-        if 'deliveryAddress' not in data:
-            api.abort(400, 'deliveryAddress is a required field')
-        # Validate deliveryAddress
-        delivery_address = data['deliveryAddress']
-        required_fields = ['street', 'city', 'state', 'postalCode', 'country']
-        if not isinstance(delivery_address, dict):
-            api.abort(400, 'deliveryAddress must be an object')
-        for field in required_fields:
-            if field not in delivery_address or not isinstance(delivery_address[field], str):
-                api.abort(400, f'deliveryAddress must contain a valid {field}')
-        users_collection = current_app.users_collection
-        # Check if any of the emails already exist
-        existing_user = users_collection.find_one({'emails': {'$in': data['emails']}})
-        if existing_user:
+        # Validate against the schema compiled at import time
+        try:
+            validate_user_create(data)
+        except fastjsonschema.JsonSchemaException as e:
+            api.abort(400, e.message)
+        users_collection = get_users_collection()
+        # Without the unique index the insert cannot reject duplicates
+        # itself, so keep the explicit (racy, but better than nothing)
+        # pre-check from the original implementation.
+        if not _email_index_ok and emails_in_use(users_collection,
+                                                 data['emails']):
             api.abort(400, 'One or more email addresses are already in use')
         # Generate a unique userId
         data['userId'] = str(uuid.uuid4())
         # Automatically set createdAt and updatedAt
-        current_time = datetime.utcnow()
+        current_time = datetime.now(timezone.utc)
         data['createdAt'] = current_time
         data['updatedAt'] = current_time
-        user_id = users_collection.insert_one(data).inserted_id
-        new_user = users_collection.find_one({'_id': ObjectId(user_id)})
-        return new_user, 201
+        # insert_one sets data['_id'] in place, so the document we already
+        # hold is the stored one; reading it back would be a wasted round trip.
+        # The unique emails index enforces uniqueness atomically, so no
+        # racy pre-check query is needed.
+        try:
+            users_collection.insert_one(data)
+        except DuplicateKeyError:
+            api.abort(400, 'One or more email addresses are already in use')
+        return data, 201
 
 @api.route('/<string:id>')
 @api.response(404, 'User not found')
@@ -100,11 +171,14 @@ class User(Resource):
       - GET: retrieve a single user by userId
       - PUT: update an existing user
     """
-    @api.marshal_with(user_model)
+    @api.doc(description='Responses may be served from a short-lived '
+                         'per-worker cache, so an update can take up to '
+                         f'{CACHE_TTL_SECONDS} seconds to be visible here.')
+    @api.response(200, 'Success', user_model)
     def get(self, id: str):
         """
         Retrieve a user by userId.
-        
+
         Args:
             id (str): The unique identifier of the user.
         Returns:
@@ -112,10 +186,16 @@ class User(Resource):
         Raises:
             404: If the user is not found.
         """
-        users_collection = current_app.users_collection
-        user = users_collection.find_one({'userId': id})
-        if not user:
-            api.abort(404, "User not found")
+        user = _USER_CACHE.get(id)
+        if user is None:
+            users_collection = get_users_collection()
+            # The projection keeps the document to the declared model
+            # fields, so it can be serialized as-is by orjson without
+            # going through field-by-field RESTx marshaling.
+            user = users_collection.find_one({'userId': id}, USER_PROJECTION)
+            if not user:
+                api.abort(404, "User not found")
+            _USER_CACHE[id] = user
         return user
     @api.expect(user_model)
     @api.marshal_with(user_model)
@@ -131,35 +211,35 @@ class User(Resource):
             data: dict = request.json
         except Exception as e:
             api.abort(400, f'Invalid JSON data: {str(e)}')
-        allowed_fields = {'emails', 'deliveryAddress'}
-        for field in data:
-            if field not in allowed_fields:
-                api.abort(400, f'Invalid field: {field}')
-        if 'emails' not in data and 'deliveryAddress' not in data:
-            api.abort(400, 'Either emails or deliveryAddress is required')
-        # Validate emails
-        if 'emails' in data:
-            if not isinstance(data['emails'], list) or not all(
-                isinstance(email, str) and '@' in email for email in data['emails']
-            ):
-                api.abort(400, 'emails must be a list of valid email addresses')
-        # Validate deliveryAddress
-        if 'deliveryAddress' in data:
-            delivery_address = data['deliveryAddress']
-            required_fields = ['street', 'city', 'state', 'postalCode', 'country']
-            if not isinstance(delivery_address, dict):
-                api.abort(400, 'deliveryAddress must be an object')
-            for field in required_fields:
-                if field not in delivery_address or not isinstance(delivery_address[field], str):
-                    api.abort(400, f'deliveryAddress must contain a valid {field}')
-        users_collection = current_app.users_collection
-        old_user = users_collection.find_one({'userId': id})
+        try:
+            validate_user_update(data)
+        except fastjsonschema.JsonSchemaException as e:
+            api.abort(400, e.message)
+        users_collection = get_users_collection()
+        # Without the unique index the update cannot reject duplicates
+        # itself, so keep the explicit (racy, but better than nothing)
+        # pre-check from the original implementation.
+        if (not _email_index_ok and 'emails' in data
+                and emails_in_use(users_collection, data['emails'],
+                                  exclude_user_id=id)):
+            api.abort(400, 'One or more email addresses are already in use')
+        # Automatically update updatedAt
+        data['updatedAt'] = datetime.now(timezone.utc)
+        # Single round trip: fetch the old document and apply the update
+        # atomically instead of find_one + update_one + find_one. The
+        # unique emails index rejects an email already owned by another
+        # user, so surface that as a 400 like the POST handler does.
+        try:
+            old_user = users_collection.find_one_and_update(
+                {'userId': id}, {'$set': data},
+                return_document=ReturnDocument.BEFORE)
+        except DuplicateKeyError:
+            api.abort(400, 'One or more email addresses are already in use')
         if not old_user:
             api.abort(404, "User not found")
-        # Automatically update updatedAt
-        data['updatedAt'] = datetime.utcnow()
-        users_collection.update_one({'userId': id}, {'$set': data})
-        new_user = users_collection.find_one({'userId': id})
+        new_user = {**old_user, **data}
+        # Drop the cached copy so subsequent GETs see the update
+        _USER_CACHE.pop(id, None)
         # Publish update event so the Order service can sync
         emails = new_user.get("emails", [])
         delivery_address = new_user.get("deliveryAddress", {})
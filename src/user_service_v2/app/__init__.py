@@ -5,11 +5,51 @@ including the Flask-RESTx API and MongoDB client.
 Author:
     @TheBarzani
 """
+import time
 from typing import Any
-from flask import Flask
+from flask import Flask, abort, request
 from flask_restx import Api
 from pymongo import MongoClient
-from user_service_v2.app.routes import api as user_api
+from pymongo.errors import OperationFailure, ServerSelectionTimeoutError
+from shared.json_provider import register_orjson
+from user_service_v2.app.routes import api as user_api, register_collection
+
+# No legitimate payload in this service comes close to this size; larger
+# bodies are rejected before any JSON parsing or validation happens.
+MAX_BODY_BYTES = 64 * 1024
+
+def ensure_indexes(users_collection) -> bool:
+    """
+    Creates the lookup and uniqueness indexes, retrying briefly in case
+    MongoDB is still starting when the service boots (compose start order
+    is not guaranteed). Index creation is idempotent, and the service can
+    still run unindexed if Mongo never becomes reachable in time.
+    Args:
+        users_collection: The PyMongo users collection.
+    Returns:
+        bool: Whether the unique emails index is in place. When it is
+              not, the handlers fall back to request-time checks.
+    """
+    for attempt in range(5):
+        try:
+            users_collection.create_index('userId', unique=True,
+                                          background=True)
+            try:
+                users_collection.create_index('emails', unique=True,
+                                              background=True)
+                return True
+            except OperationFailure as e:
+                # Pre-existing cross-document duplicates make the unique
+                # index impossible to build.
+                print(f"Could not create the unique email index ({e}); "
+                      "falling back to request-time uniqueness checks",
+                      flush=True)
+                return False
+        except ServerSelectionTimeoutError:
+            time.sleep(2)
+    print("Could not reach MongoDB to create user indexes; "
+          "falling back to request-time uniqueness checks", flush=True)
+    return False
 
 def create_app() -> Flask:
     """
@@ -25,11 +65,32 @@ def create_app() -> Flask:
     app.config.from_object('user_service_v2.app.config.Config')
     api: Api = Api(app)
     api.add_namespace(user_api, path='/users')
+    # Use orjson for request parsing and response serialization
+    register_orjson(app, api)
+
+    @app.before_request
+    def reject_oversized_body() -> None:
+        if request.content_length and request.content_length > MAX_BODY_BYTES:
+            abort(413)
 
     # Initialize MongoDB client
-    mongo_client: MongoClient = MongoClient(app.config['MONGO_URI'])
+    # Pool sized for gevent workers: many concurrent greenlets share a
+    # bounded number of sockets, with fast failure instead of pile-ups.
+    mongo_client: MongoClient = MongoClient(app.config['MONGO_URI'],
+                                            maxPoolSize=100,
+                                            minPoolSize=20,
+                                            socketTimeoutMS=5000,
+                                            serverSelectionTimeoutMS=2000,
+                                            compressors='zstd,zlib',
+                                            zlibCompressionLevel=6)
     app.mongo_client = mongo_client
     app.db = mongo_client[app.config['DATABASE_NAME']]
     app.users_collection = app.db['users']
+    # Ensure lookups by userId hit an index, and let the unique multikey
+    # index on emails enforce address uniqueness race-free at insert time.
+    app.email_uniqueness_indexed = ensure_indexes(app.users_collection)
+    # Cache the collection in the routes module so handlers bypass the
+    # current_app proxy lookup on every request.
+    register_collection(app)
 
     return app
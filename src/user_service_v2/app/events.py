@@ -1,5 +1,7 @@
 """__summary__
 This module handles the publishing of user update events to a RabbitMQ queue.
+Publishing runs on a small thread pool so broker latency never sits on the
+HTTP request path.
 
 Author:
     @TheBarzani
@@ -7,6 +9,7 @@ Author:
 
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from flask import current_app
 from dotenv import load_dotenv
 from shared.config.rabbitmq_config import create_channel
@@ -14,30 +17,45 @@ from shared.config.rabbitmq_config import create_channel
 load_dotenv()
 QUEUE_NAME = os.getenv('RABBITMQ_QUEUE_NAME')
 
+# Each submitted task opens its own channel and connection, so no pika
+# state is shared between threads.
+_PUBLISH_POOL = ThreadPoolExecutor(max_workers=4)
+
 def publish_user_update_event(user_id: int, email: str, address: str) -> None:
     """
-    Publishes an event to notify about a user update.
+    Queues an event notifying about a user update and returns immediately,
+    leaving the actual broker round trip to a background thread.
     Args:
         user_id (int): The ID of the user.
         email (str): The email address of the user.
         address (str): The delivery address of the user.
     Returns:
-        None  
+        None
     """
+    _PUBLISH_POOL.submit(_publish, user_id, email, address)
 
-    channel, connection = create_channel(QUEUE_NAME)
+def _publish(user_id: int, email: str, address: str) -> None:
+    """
+    Opens a channel, publishes the update event and closes the connection.
+    Failures are logged here because exceptions raised on the pool would
+    otherwise vanish inside an unobserved Future.
+    """
     event = {
         'userId': user_id,
         'userEmails': email,
         'deliveryAddress': address
     }
-    channel.basic_publish(
-        exchange="user_order",
-        routing_key=QUEUE_NAME,
-        body=json.dumps(event)
-        # properties=pika.BasicProperties(
-        #     delivery_mode=2,  # Make the message persistent
-        # )
-    )
-    print(f"V2 Published event: {event}", flush=True)
-    connection.close()
+    try:
+        channel, connection = create_channel(QUEUE_NAME)
+        channel.basic_publish(
+            exchange="user_order",
+            routing_key=QUEUE_NAME,
+            body=json.dumps(event)
+            # properties=pika.BasicProperties(
+            #     delivery_mode=2,  # Make the message persistent
+            # )
+        )
+        print(f"V2 Published event: {event}", flush=True)
+        connection.close()
+    except Exception as e:
+        print(f"V2 Failed to publish event {event}: {e}", flush=True)
@@ -0,0 +1,13 @@
+"""
+Shared test setup. Makes the service packages under src/ importable and
+provides the RabbitMQ settings they read at import time, so the unit
+tests can import the services without the docker-compose stack running.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, 'src'))
+
+os.environ.setdefault('RABBITMQ_HOST', 'localhost')
+os.environ.setdefault('RABBITMQ_PORT', '5672')
+os.environ.setdefault('RABBITMQ_QUEUE_NAME', 'user_updates')
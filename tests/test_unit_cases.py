@@ -0,0 +1,271 @@
+"""
+Unit tests for the behavior added on top of the original services:
+compiled payload validation, pagination parameter handling, the request
+body size cap, and duplicate-email rejection on POST and PUT.
+
+Unlike test_cases.py these do not need the docker-compose stack: the
+handlers run under Flask's test client against a stubbed collection.
+"""
+import uuid
+import fastjsonschema
+import pytest
+from flask import Flask, abort, request
+from pymongo.errors import DuplicateKeyError
+
+from shared.json_provider import register_orjson
+from shared.validation import (validate_order_create,
+                               validate_order_details_update,
+                               validate_user_create, validate_user_update)
+from flask_restx import Api
+from order_service.app import routes as order_routes
+from user_service_v2.app import MAX_BODY_BYTES
+from user_service_v2.app import routes as user_routes
+
+
+# -----------------------------------------------------------------------------
+# Test doubles and app factories
+# -----------------------------------------------------------------------------
+class FakeCollection:
+    """
+    Mimics the slice of the PyMongo collection interface the handlers
+    touch. With unique_emails=True conflicting writes raise
+    DuplicateKeyError, like the unique emails index would.
+    """
+
+    def __init__(self, docs=(), unique_emails=True):
+        self.docs = {doc['userId']: dict(doc) for doc in docs}
+        self.unique_emails = unique_emails
+
+    def with_options(self, **kwargs):
+        return self
+
+    def _email_conflict(self, emails, exclude_user_id=None):
+        for doc in self.docs.values():
+            if doc['userId'] == exclude_user_id:
+                continue
+            if set(emails) & set(doc.get('emails', [])):
+                return True
+        return False
+
+    def insert_one(self, doc):
+        if self.unique_emails and self._email_conflict(doc.get('emails', [])):
+            raise DuplicateKeyError('E11000 duplicate key error')
+        self.docs[doc['userId']] = doc
+
+    def find_one(self, query, projection=None):
+        doc = self.docs.get(query['userId'])
+        return dict(doc) if doc else None
+
+    def find_one_and_update(self, query, update, return_document=None):
+        doc = self.docs.get(query['userId'])
+        if doc is None:
+            return None
+        update_fields = update['$set']
+        if (self.unique_emails and 'emails' in update_fields
+                and self._email_conflict(update_fields['emails'],
+                                         exclude_user_id=doc['userId'])):
+            raise DuplicateKeyError('E11000 duplicate key error')
+        old = dict(doc)
+        doc.update(update_fields)
+        return old
+
+    def count_documents(self, query, limit=None):
+        emails = query['emails']['$in']
+        exclude = query.get('userId', {}).get('$ne')
+        return 1 if self._email_conflict(emails, exclude_user_id=exclude) else 0
+
+
+def make_user_app(collection, email_index_ok=True):
+    """Build the user service app around a stubbed collection, mirroring
+    the factory minus the Mongo client and event consumer."""
+    app = Flask(__name__)
+    api = Api(app)
+    api.add_namespace(user_routes.api, path='/users')
+    register_orjson(app, api)
+
+    @app.before_request
+    def reject_oversized_body():
+        if request.content_length and request.content_length > MAX_BODY_BYTES:
+            abort(413)
+
+    app.users_collection = collection
+    app.email_uniqueness_indexed = email_index_ok
+    user_routes.register_collection(app)
+    user_routes._USER_CACHE.clear()
+    return app
+
+
+def make_order_app(collection):
+    """Build the order service app around a stubbed collection."""
+    app = Flask(__name__)
+    api = Api(app)
+    api.add_namespace(order_routes.api, path='/orders')
+    register_orjson(app, api)
+    app.orders_collection = collection
+    order_routes.register_collection(app)
+    return app
+
+
+def user_payload(email=None):
+    """A valid user-creation payload without server-generated fields."""
+    return {
+        'firstName': 'Test',
+        'lastName': 'User',
+        'emails': [email or f'test_{uuid.uuid4().hex[:6]}@example.com'],
+        'phoneNumber': '1234567890',
+        'deliveryAddress': {
+            'street': '123 Main St',
+            'city': 'TestCity',
+            'state': 'TC',
+            'postalCode': '11111',
+            'country': 'Testland'
+        }
+    }
+
+
+def stored_user(user_id, email):
+    user = user_payload(email)
+    user['userId'] = user_id
+    return user
+
+
+def order_payload():
+    return {
+        'items': [{'itemId': 'item1', 'quantity': 2, 'price': 9.99}],
+        'userEmails': ['buyer@example.com'],
+        'deliveryAddress': user_payload()['deliveryAddress'],
+        'orderStatus': 'under process'
+    }
+
+
+# -----------------------------------------------------------------------------
+# Compiled validators
+# -----------------------------------------------------------------------------
+def test_user_create_validator_accepts_valid_payload():
+    validate_user_create(user_payload())
+
+
+def test_user_create_validator_rejects_incomplete_address():
+    payload = user_payload()
+    del payload['deliveryAddress']['country']
+    with pytest.raises(fastjsonschema.JsonSchemaException):
+        validate_user_create(payload)
+
+
+def test_user_create_validator_rejects_unknown_field():
+    payload = user_payload()
+    payload['isAdmin'] = True
+    with pytest.raises(fastjsonschema.JsonSchemaException):
+        validate_user_create(payload)
+
+
+def test_user_update_validator_rejects_malformed_email():
+    with pytest.raises(fastjsonschema.JsonSchemaException):
+        validate_user_update({'emails': ['not-an-email']})
+
+
+def test_order_create_validator_accepts_valid_payload():
+    validate_order_create(order_payload())
+
+
+def test_order_create_validator_rejects_bad_status():
+    payload = order_payload()
+    payload['orderStatus'] = 'lost in transit'
+    with pytest.raises(fastjsonschema.JsonSchemaException):
+        validate_order_create(payload)
+
+
+def test_order_create_validator_rejects_empty_items():
+    payload = order_payload()
+    payload['items'] = []
+    with pytest.raises(fastjsonschema.JsonSchemaException):
+        validate_order_create(payload)
+
+
+def test_order_create_validator_rejects_oversized_items():
+    payload = order_payload()
+    payload['items'] = payload['items'] * 501
+    with pytest.raises(fastjsonschema.JsonSchemaException):
+        validate_order_create(payload)
+
+
+def test_order_details_update_validator_requires_some_field():
+    with pytest.raises(fastjsonschema.JsonSchemaException):
+        validate_order_details_update({})
+
+
+# -----------------------------------------------------------------------------
+# Pagination parameters
+# -----------------------------------------------------------------------------
+def test_user_list_rejects_non_integer_page():
+    client = make_user_app(FakeCollection()).test_client()
+    assert client.get('/users/?page=abc').status_code == 400
+
+
+def test_user_list_rejects_non_positive_page_and_limit():
+    client = make_user_app(FakeCollection()).test_client()
+    assert client.get('/users/?page=0').status_code == 400
+    assert client.get('/users/?limit=-5').status_code == 400
+
+
+def test_order_list_rejects_bad_status_and_page():
+    client = make_order_app(FakeCollection()).test_client()
+    assert client.get('/orders/?status=bogus').status_code == 400
+    assert client.get('/orders/?status=shipping&page=abc').status_code == 400
+
+
+# -----------------------------------------------------------------------------
+# Request body size cap
+# -----------------------------------------------------------------------------
+def test_oversized_body_is_rejected_with_413():
+    client = make_user_app(FakeCollection()).test_client()
+    response = client.post('/users/', data=b'{' + b' ' * MAX_BODY_BYTES,
+                           content_type='application/json')
+    assert response.status_code == 413
+
+
+# -----------------------------------------------------------------------------
+# Duplicate-email rejection
+# -----------------------------------------------------------------------------
+def test_post_duplicate_email_returns_400():
+    collection = FakeCollection([stored_user('u1', 'taken@example.com')])
+    client = make_user_app(collection).test_client()
+    response = client.post('/users/', json=user_payload('taken@example.com'))
+    assert response.status_code == 400
+
+
+def test_put_duplicate_email_returns_400_not_500(monkeypatch):
+    monkeypatch.setattr(user_routes, 'publish_user_update_event',
+                        lambda *args: None)
+    collection = FakeCollection([stored_user('u1', 'a@example.com'),
+                                 stored_user('u2', 'b@example.com')])
+    client = make_user_app(collection).test_client()
+    response = client.put('/users/u1', json={'emails': ['b@example.com']})
+    assert response.status_code == 400
+
+
+def test_put_with_fresh_email_succeeds(monkeypatch):
+    published = []
+    monkeypatch.setattr(user_routes, 'publish_user_update_event',
+                        lambda *args: published.append(args))
+    collection = FakeCollection([stored_user('u1', 'a@example.com')])
+    client = make_user_app(collection).test_client()
+    response = client.put('/users/u1', json={'emails': ['fresh@example.com']})
+    assert response.status_code == 200
+    assert collection.docs['u1']['emails'] == ['fresh@example.com']
+    assert len(published) == 1
+
+
+def test_duplicate_email_still_rejected_without_unique_index(monkeypatch):
+    monkeypatch.setattr(user_routes, 'publish_user_update_event',
+                        lambda *args: None)
+    # unique_emails=False models a collection whose unique index could
+    # not be created; the handlers must fall back to the query pre-check.
+    collection = FakeCollection([stored_user('u1', 'a@example.com'),
+                                 stored_user('u2', 'b@example.com')],
+                                unique_emails=False)
+    client = make_user_app(collection, email_index_ok=False).test_client()
+    post_response = client.post('/users/', json=user_payload('a@example.com'))
+    assert post_response.status_code == 400
+    put_response = client.put('/users/u1', json={'emails': ['b@example.com']})
+    assert put_response.status_code == 400